@@ -12,6 +12,8 @@ from yarl import URL
 
 from pngx.pngx import PaperlessNGX
 
+from .correspondents import correspondents
+from .documents import documents
 from .tags import tags
 from .upload import upload
 
@@ -85,6 +87,8 @@ def pngx(
     )
 
 
+pngx.add_command(correspondents)
+pngx.add_command(documents)
 pngx.add_command(tags)
 pngx.add_command(upload)
 
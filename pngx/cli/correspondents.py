@@ -0,0 +1,44 @@
+import pathlib
+
+import click
+
+from pngx.asyncio import asyncio_run
+from pngx.pngx import PaperlessNGX
+
+from .sync import echo_changes, load_spec
+
+
+@click.group()
+@click.pass_obj
+@asyncio_run
+async def correspondents(pngx: PaperlessNGX) -> None:
+    """Commands to manipulate correspondents in Paperless NGX"""
+
+
+@correspondents.command(name="sync")
+@click.option(
+    "--concurrency",
+    "-j",
+    type=click.IntRange(min=1),
+    default=8,
+    help="Number of changes to apply at the same time",
+)
+@click.argument(
+    "filename", type=click.Path(dir_okay=False, path_type=pathlib.Path)
+)
+@click.pass_obj
+@asyncio_run
+async def correspondentsync(
+    pngx: PaperlessNGX, filename: pathlib.Path, concurrency: int
+) -> None:
+    """Make correspondents in Paperless NGX match those in a TOML file"""
+    spec = load_spec(filename)
+    try:
+        async with pngx.connect():
+            changes = await pngx.sync_correspondents(
+                spec, concurrency=concurrency
+            )
+            echo_changes(changes, no_act=pngx.no_act)
+
+    except PaperlessNGX.Exception as err:
+        raise click.UsageError(str(err)) from err
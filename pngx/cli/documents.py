@@ -0,0 +1,81 @@
+import datetime
+import json
+
+import click
+
+from pngx.asyncio import asyncio_run
+from pngx.pngx import PaperlessNGX
+
+
+@click.group()
+@click.pass_obj
+@asyncio_run
+async def documents(pngx: PaperlessNGX) -> None:
+    """Commands to query documents in Paperless NGX"""
+
+
+@documents.command(name="list")
+@click.option(
+    "--tag",
+    "-t",
+    "tags",
+    multiple=True,
+    help="Only list documents that have all of these tags",
+)
+@click.option(
+    "--correspondent",
+    "-c",
+    help="Only list documents of this correspondent",
+)
+@click.option(
+    "--created-after",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    help="Only list documents created on or after this date",
+)
+@click.option(
+    "--created-before",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    help="Only list documents created on or before this date",
+)
+@click.option("--query", help="Full-text query to match documents against")
+@click.option(
+    "--field",
+    "-f",
+    "fields",
+    multiple=True,
+    help="Only include these fields in the output",
+)
+@click.option(
+    "--page-size",
+    type=click.IntRange(min=1),
+    default=100,
+    help="Number of documents to request from the server at once",
+)
+@click.pass_obj
+@asyncio_run
+async def doclist(
+    pngx: PaperlessNGX,
+    tags: list[str],
+    correspondent: str | None,
+    created_after: datetime.datetime | None,
+    created_before: datetime.datetime | None,
+    query: str | None,
+    fields: list[str],
+    page_size: int,
+) -> None:
+    """List documents in Paperless NGX as newline-delimited JSON"""
+    try:
+        async with pngx.connect():
+            async for doc in pngx.documents(
+                tags=tags,
+                correspondent=correspondent,
+                created_after=created_after and created_after.date(),
+                created_before=created_before and created_before.date(),
+                query=query,
+                fields=fields,
+                page_size=page_size,
+            ):
+                click.echo(json.dumps(doc, ensure_ascii=False, default=str))
+
+    except PaperlessNGX.Exception as err:
+        raise click.UsageError(str(err)) from err
@@ -0,0 +1,35 @@
+import pathlib
+import tomllib
+from typing import Any
+
+import click
+
+from pngx.pngx import SyncChange
+
+
+def load_spec(path: pathlib.Path) -> dict[str, dict[str, Any]]:
+    try:
+        with path.open("rb") as f:
+            spec = tomllib.load(f)
+
+    except (OSError, tomllib.TOMLDecodeError) as err:
+        raise click.BadParameter(f"Cannot read {path}: {err}") from err
+
+    if invalid := [k for k, v in spec.items() if not isinstance(v, dict)]:
+        raise click.BadParameter(
+            f"Entries must be tables, not values: {', '.join(invalid)}"
+        )
+
+    return spec
+
+
+def echo_changes(changes: list[SyncChange], *, no_act: bool) -> None:
+    if not changes:
+        click.echo("Nothing to do")
+
+    for change in changes:
+        if not change.failed:
+            click.echo(f"Would {change}" if no_act else str(change))
+
+    if failed := sum(change.failed for change in changes):
+        raise click.ClickException(f"{failed} change(s) could not be applied")
@@ -1,8 +1,12 @@
+import pathlib
+
 import click
 
 from pngx.asyncio import asyncio_run
 from pngx.pngx import PaperlessNGX
 
+from .sync import echo_changes, load_spec
+
 
 @click.group()
 @click.pass_obj
@@ -38,3 +42,30 @@ async def taglist(pngx: PaperlessNGX, zero: bool, ids: bool) -> None:
 
     except PaperlessNGX.Exception as err:
         raise click.UsageError(str(err)) from err
+
+
+@tags.command(name="sync")
+@click.option(
+    "--concurrency",
+    "-j",
+    type=click.IntRange(min=1),
+    default=8,
+    help="Number of changes to apply at the same time",
+)
+@click.argument(
+    "filename", type=click.Path(dir_okay=False, path_type=pathlib.Path)
+)
+@click.pass_obj
+@asyncio_run
+async def tagsync(
+    pngx: PaperlessNGX, filename: pathlib.Path, concurrency: int
+) -> None:
+    """Make tags in Paperless NGX match those in a TOML file"""
+    spec = load_spec(filename)
+    try:
+        async with pngx.connect():
+            changes = await pngx.sync_tags(spec, concurrency=concurrency)
+            echo_changes(changes, no_act=pngx.no_act)
+
+    except PaperlessNGX.Exception as err:
+        raise click.UsageError(str(err)) from err
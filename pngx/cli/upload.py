@@ -1,8 +1,10 @@
+import contextlib
 import pathlib
 
 import click
 
 from pngx.asyncio import asyncio_run
+from pngx.journal import UploadJournal
 from pngx.pngx import PaperlessNGX
 
 
@@ -60,6 +62,28 @@ from pngx.pngx import PaperlessNGX
     default=3,
     help="Retry this many times to upload documents",
 )
+@click.option(
+    "--concurrency",
+    "-j",
+    type=click.IntRange(min=1),
+    default=8,
+    help="Number of files to upload at the same time",
+)
+@click.option(
+    "--validate/--no-validate",
+    default=True,
+    help="Check files for type and integrity before uploading them",
+)
+@click.option(
+    "--max-size",
+    type=click.IntRange(min=1),
+    help="Do not upload files larger than this many MiB",
+)
+@click.option(
+    "--journal",
+    type=click.Path(dir_okay=False, path_type=pathlib.Path),
+    help="Record uploads in this file, and skip files already uploaded",
+)
 @click.argument("filenames", type=click.Path(path_type=pathlib.Path), nargs=-1)
 @click.pass_obj
 @asyncio_run
@@ -75,22 +99,35 @@ async def upload(
     dateres: list[str],
     nameres: list[str],
     tries: int,
+    concurrency: int,
+    validate: bool,
+    max_size: int | None,
+    journal: pathlib.Path | None,
 ) -> None:
     """Upload files to Paperless NGX"""
     try:
-        async with pngx.connect():
-            await pngx.upload(
-                filenames,
-                owner=owner,
-                groups=groups,
-                correspondent=correspondent,
-                correspondent_must_exist=correspondent_must_exist,
-                tags=tags,
-                tags_must_exist=tags_must_exist,
-                dateres=dateres,
-                nameres=nameres,
-                tries=tries,
-            )
+        with (
+            UploadJournal(journal, read_only=pngx.no_act)
+            if journal
+            else contextlib.nullcontext()
+        ) as upload_journal:
+            async with pngx.connect():
+                await pngx.upload(
+                    filenames,
+                    owner=owner,
+                    groups=groups,
+                    correspondent=correspondent,
+                    correspondent_must_exist=correspondent_must_exist,
+                    tags=tags,
+                    tags_must_exist=tags_must_exist,
+                    dateres=dateres,
+                    nameres=nameres,
+                    tries=tries,
+                    concurrency=concurrency,
+                    journal=upload_journal,
+                    validate=validate,
+                    max_size=max_size and max_size * 2**20,
+                )
 
     except PaperlessNGX.Exception as err:
         raise click.UsageError(str(err)) from err
@@ -0,0 +1,151 @@
+# needed < 3.14 so that annotations aren't evaluated
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pathlib
+    from types import TracebackType
+    from typing import IO, Literal, Type
+
+    type Outcome = Literal["uploaded", "failed"]
+
+
+logger = logging.getLogger(__name__)
+
+
+class UploadJournal:
+    """Append-only record of upload outcomes, one JSON object per line
+
+    Later entries for the same path supersede earlier ones, so a file that
+    failed and was then uploaded on a rerun is considered done. Writes are
+    flushed immediately, but only synced to disk every `sync_every` entries
+    or `sync_interval` seconds, whichever comes first. A read-only journal
+    is never created or written to, but still tells which files are done.
+    """
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        *,
+        sync_every: int = 64,
+        sync_interval: float = 1.0,
+        read_only: bool = False,
+    ) -> None:
+        self._path = path
+        self._read_only = read_only
+        self._sync_every = sync_every
+        self._sync_interval = sync_interval
+        self._index: dict[str, tuple[int, int, str]] = {}
+        self._file: IO[str] | None = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def __enter__(self) -> UploadJournal:
+        self._load()
+        if self._read_only:
+            return self
+
+        self._file = self._path.open("a", encoding="utf-8")
+        if self._file.tell() > 0:
+            with self._path.open("rb") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    # do not append to a line cut short by a crash
+                    self._file.write("\n")
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> Literal[False]:
+        if self._file is not None:
+            self._sync()
+            self._file.close()
+            self._file = None
+        return False
+
+    @staticmethod
+    def _key(file: pathlib.Path) -> str:
+        return os.path.abspath(file)
+
+    def _load(self) -> None:
+        try:
+            f = self._path.open(encoding="utf-8")
+
+        except FileNotFoundError:
+            return
+
+        with f:
+            for lineno, line in enumerate(f, start=1):
+                try:
+                    entry = json.loads(line)
+                    self._index[entry["path"]] = (
+                        entry["size"],
+                        entry["mtime"],
+                        entry["outcome"],
+                    )
+
+                except (ValueError, KeyError, TypeError):
+                    # most likely a line cut short by a crash
+                    logger.warning(
+                        f"Ignoring invalid entry in journal "
+                        f"{self._path}:{lineno}"
+                    )
+
+        logger.debug(f"Loaded {len(self._index)} entries from {self._path}")
+
+    def _sync(self) -> None:
+        if self._file is not None and self._unsynced:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+            self._last_sync = time.monotonic()
+
+    def is_done(self, file: pathlib.Path, stat: os.stat_result) -> bool:
+        entry = self._index.get(self._key(file))
+        return entry == (stat.st_size, stat.st_mtime_ns, "uploaded")
+
+    def record(
+        self,
+        file: pathlib.Path,
+        stat: os.stat_result | None,
+        outcome: Outcome,
+        taskid: str | None = None,
+    ) -> None:
+        if self._file is None:
+            raise RuntimeError("Journal is not open")
+
+        key = self._key(file)
+        size = stat.st_size if stat else None
+        mtime = stat.st_mtime_ns if stat else None
+        self._file.write(
+            json.dumps(
+                {
+                    "path": key,
+                    "size": size,
+                    "mtime": mtime,
+                    "outcome": outcome,
+                    "taskid": taskid,
+                    "time": time.time(),
+                },
+                ensure_ascii=False,
+            )
+            + "\n"
+        )
+        self._file.flush()
+        self._unsynced += 1
+        if size is not None and mtime is not None:
+            self._index[key] = (size, mtime, outcome)
+
+        if (
+            self._unsynced >= self._sync_every
+            or time.monotonic() - self._last_sync >= self._sync_interval
+        ):
+            self._sync()
@@ -3,9 +3,13 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import dataclasses
+import functools
 import logging
+import os
 import random
 import re
+import time
 from typing import TYPE_CHECKING
 
 import aiohttp
@@ -19,14 +23,24 @@ from pypaperless.models.common import (
 )
 from yarl import URL
 
-from pngx.wrapper import PaperlessObjectWrapper
+from pngx.validate import validate_file
+from pngx.wrapper import PaperlessObjectWrapper, normalise_name
 
 if TYPE_CHECKING:
+    import datetime
     import pathlib
-    from collections.abc import AsyncGenerator
+    from collections.abc import (
+        AsyncGenerator,
+        AsyncIterable,
+        AsyncIterator,
+        Awaitable,
+        Callable,
+        Mapping,
+    )
     from types import TracebackType
     from typing import Any, Literal, Type
 
+    from pngx.journal import UploadJournal
     from pngx.wrapper import Cache
 
     BaseClass = contextlib.AbstractContextManager["PaperlessNGX"]
@@ -37,6 +51,52 @@ else:
 logger = logging.getLogger(__name__)
 
 
+@dataclasses.dataclass
+class SyncChange:
+    name: str
+    id: int | None
+    fields: dict[str, tuple[Any, Any]]
+    error: BaseException | None = None
+    is_create: bool = dataclasses.field(init=False)
+
+    def __post_init__(self) -> None:
+        self.is_create = self.id is None
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+    def __str__(self) -> str:
+        def fmt(value: Any) -> str:
+            if isinstance(value, MatchingAlgorithmType):
+                return value.name.lower()
+            return repr(value)
+
+        if self.is_create:
+            return f"create '{self.name}': " + ", ".join(
+                f"{k}={fmt(new)}" for k, (_, new) in self.fields.items()
+            )
+        return f"update '{self.name}': " + ", ".join(
+            f"{k} {fmt(old)} → {fmt(new)}"
+            for k, (old, new) in self.fields.items()
+        )
+
+
+@dataclasses.dataclass
+class UploadResult:
+    file: pathlib.Path
+    taskid: str | None = None
+    size: int = 0
+    tries: int = 0
+    elapsed: float = 0.0
+    error: BaseException | None = None
+    skipped: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class PaperlessNGX(BaseClass):
     class Exception(RuntimeError):
         pass
@@ -51,6 +111,15 @@ class PaperlessNGX(BaseClass):
     class MissingObjectError(Exception):
         pass
 
+    class InvalidSpecError(Exception):
+        pass
+
+    class AmbiguousObjectError(Exception):
+        pass
+
+    class InvalidFileError(Exception):
+        pass
+
     def __init__(self, *, url: URL, token: str, no_act: bool = False) -> None:
         self._timeout = aiohttp.ClientTimeout(
             connect=30, sock_connect=30, sock_read=120
@@ -65,6 +134,10 @@ class PaperlessNGX(BaseClass):
         self._api_correspondents: PaperlessObjectWrapper | None = None
         self._api_doctypes: PaperlessObjectWrapper | None = None
 
+    @property
+    def no_act(self) -> bool:
+        return self._no_act
+
     def __enter__(self) -> PaperlessNGX:
         return self
 
@@ -101,12 +174,15 @@ class PaperlessNGX(BaseClass):
                 self._api.users, namecol="username"
             )
             self._api_groups = PaperlessObjectWrapper(self._api.groups)
-            self._api_tags = PaperlessObjectWrapper(self._api.tags)
+            # these are created case-insensitive, so look them up that way
+            self._api_tags = PaperlessObjectWrapper(
+                self._api.tags, normalise=normalise_name
+            )
             self._api_correspondents = PaperlessObjectWrapper(
-                self._api.correspondents
+                self._api.correspondents, normalise=normalise_name
             )
             self._api_doctypes = PaperlessObjectWrapper(
-                self._api.document_types
+                self._api.document_types, normalise=normalise_name
             )
 
             yield self
@@ -128,23 +204,58 @@ class PaperlessNGX(BaseClass):
             return await self._api_groups.get_id_by_name(groupname, **args)
         raise self.APINotConnectedError
 
+    async def _find_name(
+        self, wrapper: PaperlessObjectWrapper, kind: str, name: str
+    ) -> str | None:
+        try:
+            return await wrapper.find_name(name)
+        except PaperlessObjectWrapper.AmbiguousNameError as err:
+            raise self.AmbiguousObjectError(f"{kind} {err}") from err
+
+    async def _get_normalised_id_by_name(
+        self, wrapper: PaperlessObjectWrapper, kind: str, name: str, **args: Any
+    ) -> int:
+        try:
+            return await wrapper.get_id_by_name(name, **args)
+        except PaperlessObjectWrapper.AmbiguousNameError as err:
+            raise self.AmbiguousObjectError(f"{kind} {err}") from err
+
     async def _get_tag_id_by_name(self, tagname: str, **args: Any) -> int:
         if self._api_tags is not None:
-            return await self._api_tags.get_id_by_name(tagname, **args)
+            return await self._get_normalised_id_by_name(
+                self._api_tags, "Tag", tagname, **args
+            )
         raise self.APINotConnectedError
 
     async def _get_correspondent_id_by_name(
         self, correspondent: str, **args: Any
     ) -> int:
         if self._api_correspondents is not None:
-            return await self._api_correspondents.get_id_by_name(
-                correspondent, **args
+            return await self._get_normalised_id_by_name(
+                self._api_correspondents, "Correspondent", correspondent, **args
             )
         raise self.APINotConnectedError
 
     async def _get_doctype_id_by_name(self, doctype: str, **args: Any) -> int:
         if self._api_doctypes is not None:
-            return await self._api_doctypes.get_id_by_name(doctype, **args)
+            return await self._get_normalised_id_by_name(
+                self._api_doctypes, "Document type", doctype, **args
+            )
+        raise self.APINotConnectedError
+
+    async def _get_tag_name_by_id(self, id: int) -> str:
+        if self._api_tags is not None:
+            return await self._api_tags.get_name_by_id(id)
+        raise self.APINotConnectedError
+
+    async def _get_correspondent_name_by_id(self, id: int) -> str:
+        if self._api_correspondents is not None:
+            return await self._api_correspondents.get_name_by_id(id)
+        raise self.APINotConnectedError
+
+    async def _get_doctype_name_by_id(self, id: int) -> str:
+        if self._api_doctypes is not None:
+            return await self._api_doctypes.get_name_by_id(id)
         raise self.APINotConnectedError
 
     async def _make_permission_table(
@@ -164,6 +275,29 @@ class PaperlessNGX(BaseClass):
 
         return PermissionTableType()
 
+    async def _make_permission_set(
+        self, spec: Mapping[str, list[str]]
+    ) -> PermissionSetType:
+        users: list[int] = []
+        for u in spec.get("users", []):
+            try:
+                users.append(await self._get_user_id_by_name(u))
+            except KeyError as err:
+                raise self.MissingObjectError(
+                    f"User '{u}' does not exist"
+                ) from err
+
+        groups: list[int] = []
+        for g in spec.get("groups", []):
+            try:
+                groups.append(await self._get_group_id_by_name(g))
+            except KeyError as err:
+                raise self.MissingObjectError(
+                    f"Group '{g}' does not exist"
+                ) from err
+
+        return PermissionSetType(users=sorted(users), groups=sorted(groups))
+
     async def _get_or_make_tags(
         self,
         tags: list[str],
@@ -251,26 +385,16 @@ class PaperlessNGX(BaseClass):
                 "(and upload.correspondent_must_exist is set)"
             ) from err
 
-    async def upload(
+    async def _get_upload_ids(
         self,
-        filenames: list[pathlib.Path],
         *,
-        owner: str | None = None,
-        groups: list[str] | None = None,
-        correspondent: str | None = None,
-        correspondent_must_exist: bool = False,
-        tags: list[str] | None = None,
-        tags_must_exist: bool = False,
-        dateres: list[str] | None = None,
-        nameres: list[str] | None = None,
-        tries: int = 1,
-    ) -> None:
-        if not filenames:
-            return
-
-        if self._api is None:
-            raise RuntimeError("API is not connected")
-
+        owner: str | None,
+        groups: list[str] | None,
+        correspondent: str | None,
+        correspondent_must_exist: bool,
+        tags: list[str] | None,
+        tags_must_exist: bool,
+    ) -> tuple[list[int], int | None]:
         try:
             if tags is not None:
                 tag_ids: list[int] = await self._get_or_make_tags(
@@ -306,26 +430,185 @@ class PaperlessNGX(BaseClass):
             else:
                 raise
 
+        return tag_ids, correspondent_id
+
+    async def upload_iter(
+        self,
+        files: AsyncIterable[pathlib.Path],
+        *,
+        owner: str | None = None,
+        groups: list[str] | None = None,
+        correspondent: str | None = None,
+        correspondent_must_exist: bool = False,
+        tags: list[str] | None = None,
+        tags_must_exist: bool = False,
+        dateres: list[str] | None = None,
+        nameres: list[str] | None = None,
+        tries: int = 1,
+        journal: UploadJournal | None = None,
+        validate: bool = True,
+        max_size: int | None = None,
+        concurrency: int = 8,
+    ) -> AsyncGenerator[UploadResult, None]:
+        if self._api is None:
+            raise self.APINotConnectedError
+
+        tag_ids, correspondent_id = await self._get_upload_ids(
+            owner=owner,
+            groups=groups,
+            correspondent=correspondent,
+            correspondent_must_exist=correspondent_must_exist,
+            tags=tags,
+            tags_must_exist=tags_must_exist,
+        )
+
+        upload_single = functools.partial(
+            self._upload_single,
+            owner=owner,
+            groups=groups,
+            tags=tag_ids,
+            correspondent=correspondent_id,
+            dateres=dateres,
+            nameres=nameres,
+            tries=tries,
+            journal=journal,
+            validate=validate,
+            max_size=max_size,
+        )
+
+        # Wait for inputs and uploads at the same time, so that results are
+        # yielded as soon as they are available. Uploads already in flight
+        # carry on while the caller processes a result, but the next input
+        # is only pulled while fewer than `concurrency` uploads are running,
+        # so a slow caller holds back new uploads.
+        inputs: AsyncIterator[pathlib.Path] | None = aiter(files)
+        nextfile: asyncio.Future[pathlib.Path | None] | None = None
+        uploads: set[asyncio.Future[UploadResult]] = set()
         try:
-            await asyncio.gather(
-                *[
-                    self._upload_single(
-                        file,
-                        owner=owner,
-                        groups=groups,
-                        tags=tag_ids,
-                        correspondent=correspondent_id,
-                        dateres=dateres,
-                        nameres=nameres,
+            while True:
+                if (
+                    nextfile is None
+                    and inputs is not None
+                    and len(uploads) < concurrency
+                ):
+                    nextfile = asyncio.ensure_future(anext(inputs, None))
+
+                if not (done := await self._wait_first(nextfile, uploads)):
+                    break
+
+                if nextfile is not None and nextfile in done:
+                    done.remove(nextfile)
+                    more, skipped = self._start_upload(
+                        nextfile.result(), uploads, upload_single, journal
                     )
-                    for file in filenames
-                ]
-            )
+                    if not more:
+                        inputs = None
+                    if skipped is not None:
+                        yield skipped
+                    nextfile = None
+
+                for task in done:
+                    uploads.remove(task)
+                    yield task.result()
+
+        finally:
+            self._cancel_all(nextfile, *uploads)
+
+    @staticmethod
+    def _cancel_all(*futures: asyncio.Future[Any] | None) -> None:
+        for future in futures:
+            if future is not None:
+                future.cancel()
+
+    @staticmethod
+    async def _wait_first(
+        nextfile: asyncio.Future[pathlib.Path | None] | None,
+        uploads: set[asyncio.Future[UploadResult]],
+    ) -> set[asyncio.Future[Any]]:
+        waitfor: set[asyncio.Future[Any]] = set(uploads)
+        if nextfile is not None:
+            waitfor.add(nextfile)
+        if not waitfor:
+            return set()
+
+        done, _ = await asyncio.wait(
+            waitfor, return_when=asyncio.FIRST_COMPLETED
+        )
+        return done
+
+    def _start_upload(
+        self,
+        file: pathlib.Path | None,
+        uploads: set[asyncio.Future[UploadResult]],
+        upload_single: Callable[[pathlib.Path], Awaitable[UploadResult]],
+        journal: UploadJournal | None,
+    ) -> tuple[bool, UploadResult | None]:
+        # returns whether there are more inputs, and the result for the
+        # file if it was skipped
+        if file is None:
+            return False, None
+
+        if journal is not None and self._is_done(file, journal):
+            return True, UploadResult(file, skipped=True)
+
+        uploads.add(asyncio.ensure_future(upload_single(file)))
+        return True, None
+
+    async def upload(
+        self,
+        filenames: list[pathlib.Path],
+        *,
+        owner: str | None = None,
+        groups: list[str] | None = None,
+        correspondent: str | None = None,
+        correspondent_must_exist: bool = False,
+        tags: list[str] | None = None,
+        tags_must_exist: bool = False,
+        dateres: list[str] | None = None,
+        nameres: list[str] | None = None,
+        tries: int = 1,
+        journal: UploadJournal | None = None,
+        validate: bool = True,
+        max_size: int | None = None,
+        concurrency: int = 8,
+    ) -> None:
+        if not filenames:
+            return
+
+        async def files() -> AsyncGenerator[pathlib.Path, None]:
+            for file in filenames:
+                yield file
+
+        async for _ in self.upload_iter(
+            files(),
+            owner=owner,
+            groups=groups,
+            correspondent=correspondent,
+            correspondent_must_exist=correspondent_must_exist,
+            tags=tags,
+            tags_must_exist=tags_must_exist,
+            dateres=dateres,
+            nameres=nameres,
+            tries=tries,
+            journal=journal,
+            validate=validate,
+            max_size=max_size,
+            concurrency=concurrency,
+        ):
+            pass
+
+    @staticmethod
+    def _is_done(file: pathlib.Path, journal: UploadJournal) -> bool:
+        try:
+            if journal.is_done(file, file.stat()):
+                logger.info(f"Skipping {file}, already uploaded as per journal")
+                return True
 
-        except aiohttp.client_exceptions.ClientResponseError as err:
-            logger.error(f"API request denied: {err}")
+        except OSError:
+            # let the upload itself report the problem
+            pass
 
-        return None
+        return False
 
     def _make_title(self, filename: str, nameres: list[str] | None) -> str:
         title: str = filename
@@ -386,23 +669,24 @@ class PaperlessNGX(BaseClass):
         self,
         file: pathlib.Path,
         **kwargs: Any,
-    ) -> str | None:
+    ) -> tuple[str | None, int]:
         if self._no_act:
             logger.info(f"Would upload file {file}:")
             del kwargs["file"]
             for k, v in kwargs.items():
                 if v is not None and v != []:
                     logger.info(f"  {k}: {v}")
-            return None
+            return None, 0
         else:
             if self._api is not None:
                 async with async_open(file, "rb") as f:
+                    document: bytes = await f.read()
                     draft = self._api.documents.draft(
-                        document=await f.read(), filename=file.name, **kwargs
+                        document=document, filename=file.name, **kwargs
                     )
                     taskid: str = await draft.save()
                 logger.info(f"File {file} uploaded, task ID {taskid}")
-                return taskid
+                return taskid, len(document)
             else:
                 raise self.APINotConnectedError
 
@@ -417,58 +701,456 @@ class PaperlessNGX(BaseClass):
         dateres: list[str] | None = None,
         nameres: list[str] | None = None,
         tries: int = 1,
-    ) -> int | str | tuple[int, int] | None:
-        creationdate, title = self._parse_filename(file)
+        journal: UploadJournal | None = None,
+        validate: bool = True,
+        max_size: int | None = None,
+    ) -> UploadResult:
+        creationdate, title = self._parse_filename(file, dateres, nameres)
 
+        # stat before reading, so that changes during the upload get noticed
         try:
-            return await self._do_upload(
-                file=file,
-                title=title,
-                tags=tags,
-                correspondent=correspondent,
-                created=creationdate,
-            )
+            stat: os.stat_result | None = file.stat()
+        except OSError:
+            stat = None
+
+        if rejected := await self._validate_upload(
+            file, stat, journal, validate=validate, max_size=max_size
+        ):
+            return rejected
+
+        result = UploadResult(file)
+        started = time.monotonic()
+        while True:
+            result.tries += 1
+            try:
+                result.taskid, result.size = await self._do_upload(
+                    file=file,
+                    title=title,
+                    tags=tags,
+                    correspondent=correspondent,
+                    created=creationdate,
+                )
+                result.error = None
+                break
 
-        except aiohttp.client_exceptions.ServerTimeoutError as err:
-            logger.warning(
-                f"Connection problem during upload of file {file}: {err}"
-            )
+            except aiohttp.client_exceptions.ServerTimeoutError as err:
+                logger.warning(
+                    f"Connection problem during upload of file {file}: {err}"
+                )
+                result.error = err
 
-        except pypaperless.exceptions.BadJsonResponseError as err:
-            logger.warning(
-                "Paperless reported an error with "
-                f"the upload of file {file}: {err}"
-            )
+            except pypaperless.exceptions.BadJsonResponseError as err:
+                logger.warning(
+                    "Paperless reported an error with "
+                    f"the upload of file {file}: {err}"
+                )
+                result.error = err
 
-        except FileNotFoundError as err:
-            logger.error(f"File not found: {err.filename}")
-            return None
+            except FileNotFoundError as err:
+                logger.error(f"File not found: {err.filename}")
+                result.error = err
+                break
 
-        except Exception as err:
-            logger.exception(
-                f"Received other exception during upload of file {file}: {err}"
-            )
+            except Exception as err:
+                logger.exception(
+                    "Received other exception during upload "
+                    f"of file {file}: {err}"
+                )
+                result.error = err
 
-        if (tries := tries - 1) > 0:
-            logger.info(f"Upload of {file} failed, retrying {tries} time(s)…")
-            await asyncio.sleep(1)
-            return await self._upload_single(
-                file,
-                owner=owner,
-                groups=groups,
-                tags=tags,
-                correspondent=correspondent,
-                dateres=dateres,
-                nameres=nameres,
-                tries=tries,
-            )
+            if (tries := tries - 1) > 0:
+                logger.info(
+                    f"Upload of {file} failed, retrying {tries} time(s)…"
+                )
+                await asyncio.sleep(1)
 
-        else:
-            logger.error(f"Upload of {file} failed all retries.")
+            else:
+                logger.error(f"Upload of {file} failed all retries.")
+                break
+
+        result.elapsed = time.monotonic() - started
+        self._record_result(result, stat, journal)
+        return result
+
+    async def _validate_upload(
+        self,
+        file: pathlib.Path,
+        stat: os.stat_result | None,
+        journal: UploadJournal | None,
+        *,
+        validate: bool,
+        max_size: int | None,
+    ) -> UploadResult | None:
+        started = time.monotonic()
+        reason: str | None = None
+        if max_size is not None and stat and stat.st_size > max_size:
+            reason = f"File is larger than {max_size} bytes: {stat.st_size}"
+
+        elif validate:
+            try:
+                # reading from disk would block the loop driving the uploads
+                await asyncio.to_thread(validate_file, file)
+
+            except ValueError as err:
+                reason = str(err)
+
+            except OSError:
+                # the upload will report this in the same way as usual
+                pass
+
+        if reason is None:
             return None
 
+        logger.error(f"Not uploading file {file}: {reason}")
+        result = UploadResult(
+            file,
+            error=self.InvalidFileError(f"{file}: {reason}"),
+            elapsed=time.monotonic() - started,
+        )
+        self._record_result(result, stat, journal)
+        return result
+
+    def _record_result(
+        self,
+        result: UploadResult,
+        stat: os.stat_result | None,
+        journal: UploadJournal | None,
+    ) -> None:
+        if journal is not None and not self._no_act:
+            journal.record(
+                result.file,
+                stat,
+                "uploaded" if result.ok else "failed",
+                result.taskid,
+            )
+
     async def tags(self) -> Cache:
         if self._api_tags is not None:
             return await self._api_tags.get_all()
 
         raise self.APINotConnectedError
+
+    async def _resolve_document_names(
+        self, doc: dict[str, Any]
+    ) -> dict[str, Any]:
+        async def resolve(
+            id: int, lookup: Callable[[int], Awaitable[str]]
+        ) -> str | int:
+            try:
+                return await lookup(id)
+
+            except KeyError:
+                # not visible to us, or created since the cache was loaded
+                logger.debug(
+                    f"Cannot resolve ID {id} of document {doc.get('id')}"
+                )
+                return id
+
+        if tags := doc.get("tags"):
+            doc["tags"] = [
+                await resolve(t, self._get_tag_name_by_id) for t in tags
+            ]
+        if (corr := doc.get("correspondent")) is not None:
+            doc["correspondent"] = await resolve(
+                corr, self._get_correspondent_name_by_id
+            )
+        if (doctype := doc.get("document_type")) is not None:
+            doc["document_type"] = await resolve(
+                doctype, self._get_doctype_name_by_id
+            )
+        return doc
+
+    async def _document_filters(
+        self,
+        *,
+        tags: list[str] | None,
+        correspondent: str | None,
+        created_after: datetime.date | None,
+        created_before: datetime.date | None,
+    ) -> dict[str, str | int]:
+        filters: dict[str, str | int] = {}
+        if tags:
+            tag_ids: list[int] = []
+            for t in tags:
+                try:
+                    tag_ids.append(await self._get_tag_id_by_name(t))
+
+                except KeyError as err:
+                    raise self.MissingObjectError(
+                        f"Tag '{t}' does not exist"
+                    ) from err
+            filters["tags__id__all"] = ",".join(map(str, tag_ids))
+
+        if correspondent:
+            try:
+                correspondent_id = await self._get_correspondent_id_by_name(
+                    correspondent
+                )
+
+            except KeyError as err:
+                raise self.MissingObjectError(
+                    f"Correspondent '{correspondent}' does not exist"
+                ) from err
+            filters["correspondent__id"] = correspondent_id
+
+        if created_after:
+            filters["created__date__gte"] = created_after.isoformat()
+        if created_before:
+            filters["created__date__lte"] = created_before.isoformat()
+
+        return filters
+
+    async def documents(
+        self,
+        *,
+        tags: list[str] | None = None,
+        correspondent: str | None = None,
+        created_after: datetime.date | None = None,
+        created_before: datetime.date | None = None,
+        query: str | None = None,
+        fields: list[str] | None = None,
+        page_size: int = 100,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        if self._api is None:
+            raise self.APINotConnectedError
+
+        filters = await self._document_filters(
+            tags=tags,
+            correspondent=correspondent,
+            created_after=created_after,
+            created_before=created_before,
+        )
+        if query:
+            filters["query"] = query
+        if fields:
+            filters["fields"] = ",".join(fields)
+
+        async with self._api.documents.reduce(**filters) as helper:
+            pages = helper.pages(page_size=page_size)
+
+        # Work on raw result dicts rather than model instances, and always
+        # keep the request for the next page in flight while the caller
+        # consumes the current one, so that only two pages are ever held
+        # in memory.
+        nextpage = asyncio.ensure_future(anext(pages, None))
+        try:
+            while (page := await nextpage) is not None:
+                nextpage = asyncio.ensure_future(anext(pages, None))
+                # yield to the loop once so that the request goes out
+                await asyncio.sleep(0)
+                for doc in page.results:
+                    yield await self._resolve_document_names(doc)
+
+        finally:
+            nextpage.cancel()
+
+    async def _resolve_sync_spec(
+        self, name: str, spec: Mapping[str, Any], fields: set[str]
+    ) -> dict[str, Any]:
+        if unknown := set(spec) - fields - {"owner", "permissions"}:
+            raise self.InvalidSpecError(
+                f"Unknown fields for '{name}': {', '.join(sorted(unknown))}"
+            )
+
+        ret: dict[str, Any] = {k: v for k, v in spec.items() if k in fields}
+
+        if (algo := ret.get("matching_algorithm")) is not None:
+            try:
+                ret["matching_algorithm"] = (
+                    MatchingAlgorithmType[algo.upper()]
+                    if isinstance(algo, str)
+                    else MatchingAlgorithmType(algo)
+                )
+            except KeyError:
+                ret["matching_algorithm"] = MatchingAlgorithmType.UNKNOWN
+
+            if ret["matching_algorithm"] is MatchingAlgorithmType.UNKNOWN:
+                raise self.InvalidSpecError(
+                    f"Invalid matching algorithm for '{name}': {algo}"
+                )
+
+        if (owner := spec.get("owner")) is not None:
+            try:
+                ret["owner"] = await self._get_user_id_by_name(owner)
+            except KeyError as err:
+                raise self.MissingObjectError(
+                    f"User '{owner}' does not exist"
+                ) from err
+
+        if (perms := spec.get("permissions")) is not None:
+            ret["permissions"] = PermissionTableType(
+                view=await self._make_permission_set(perms.get("view", {})),
+                change=await self._make_permission_set(perms.get("change", {})),
+            )
+
+        return ret
+
+    @staticmethod
+    def _diff_sync_object(
+        obj: Any, want: Mapping[str, Any]
+    ) -> dict[str, tuple[Any, Any]]:
+        ret: dict[str, tuple[Any, Any]] = {}
+        for field, value in want.items():
+            have = getattr(obj, field, None)
+            if field == "permissions" and have is not None:
+                # the server returns IDs in no particular order
+                have = PermissionTableType(
+                    view=PermissionSetType(
+                        users=sorted(have.view.users),
+                        groups=sorted(have.view.groups),
+                    ),
+                    change=PermissionSetType(
+                        users=sorted(have.change.users),
+                        groups=sorted(have.change.groups),
+                    ),
+                )
+            if have != value:
+                ret[field] = (have, value)
+        return ret
+
+    def _check_sync_names(self, spec: Mapping[str, Any]) -> None:
+        # these would all end up at the same server object
+        seen: dict[str, str] = {}
+        for name in spec:
+            if (other := seen.setdefault(normalise_name(name), name)) != name:
+                raise self.InvalidSpecError(
+                    f"'{other}' and '{name}' only differ in case or whitespace"
+                )
+
+    async def _sync(
+        self,
+        helper: Any,
+        wrapper: PaperlessObjectWrapper,
+        kind: str,
+        spec: Mapping[str, Mapping[str, Any]],
+        *,
+        fields: set[str],
+        defaults: Mapping[str, Any],
+        make_defaults: Callable[[], dict[str, Any]] = dict,
+        concurrency: int = 8,
+    ) -> list[SyncChange]:
+        self._check_sync_names(spec)
+
+        # load the entire server state once, including the permissions, so
+        # that the diff can be computed without any further requests
+        previous = helper.request_permissions
+        helper.request_permissions = True
+        try:
+            objects = await wrapper.get_all_objects(reload=True)
+        finally:
+            helper.request_permissions = previous
+
+        changes: list[SyncChange] = []
+        targets: dict[str, Any] = {}
+        for name, entry in spec.items():
+            want = await self._resolve_sync_spec(name, entry, fields)
+            if (found := await self._find_name(wrapper, kind, name)) is None:
+                changes.append(
+                    SyncChange(
+                        name,
+                        None,
+                        {k: (None, v) for k, v in (defaults | want).items()},
+                    )
+                )
+                continue
+
+            # the server would not let us create a name differing only in
+            # case or whitespace, so rename the existing object instead
+            targets[name] = obj = objects[found]
+            if diff := self._diff_sync_object(obj, {"name": name} | want):
+                changes.append(SyncChange(name, obj.id, diff))
+
+        if self._no_act or not changes:
+            return changes
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def apply(change: SyncChange) -> None:
+            values = {k: new for k, (_, new) in change.fields.items()}
+            async with semaphore:
+                try:
+                    if change.is_create:
+                        owner = values.pop("owner", None)
+                        perms = values.pop("permissions", None)
+                        change.id = await wrapper.get_id_by_name(
+                            change.name,
+                            make=True,
+                            # not part of the plan, as they differ every time
+                            make_args=make_defaults() | values,
+                            owner=owner,
+                            permissions_table=perms,
+                        )
+                        logger.info(f"Created '{change.name}' ({change.id})")
+
+                    else:
+                        obj = targets[change.name]
+                        for k, v in values.items():
+                            setattr(obj, k, v)
+                        await obj.update()
+                        logger.info(f"Updated '{change.name}' ({change.id})")
+
+                except (
+                    aiohttp.client_exceptions.ClientResponseError,
+                    pypaperless.exceptions.PaperlessError,
+                ) as err:
+                    logger.error(f"Failed to {change}: {err}")
+                    change.error = err
+
+        await asyncio.gather(*[apply(change) for change in changes])
+        return changes
+
+    async def sync_tags(
+        self,
+        spec: Mapping[str, Mapping[str, Any]],
+        *,
+        concurrency: int = 8,
+    ) -> list[SyncChange]:
+        if self._api is None or self._api_tags is None:
+            raise self.APINotConnectedError
+
+        return await self._sync(
+            self._api.tags,
+            self._api_tags,
+            "Tag",
+            spec,
+            fields={
+                "color",
+                "is_inbox_tag",
+                "is_insensitive",
+                "match",
+                "matching_algorithm",
+            },
+            defaults={
+                "is_inbox_tag": False,
+                "is_insensitive": True,
+                "match": "",
+                "matching_algorithm": MatchingAlgorithmType.NONE,
+            },
+            make_defaults=lambda: {
+                "color": "#%06x" % random.randrange(2**24),
+            },
+            concurrency=concurrency,
+        )
+
+    async def sync_correspondents(
+        self,
+        spec: Mapping[str, Mapping[str, Any]],
+        *,
+        concurrency: int = 8,
+    ) -> list[SyncChange]:
+        if self._api is None or self._api_correspondents is None:
+            raise self.APINotConnectedError
+
+        return await self._sync(
+            self._api.correspondents,
+            self._api_correspondents,
+            "Correspondent",
+            spec,
+            fields={"is_insensitive", "match", "matching_algorithm"},
+            defaults={
+                "is_insensitive": True,
+                "match": "",
+                "matching_algorithm": MatchingAlgorithmType.AUTO,
+            },
+            concurrency=concurrency,
+        )
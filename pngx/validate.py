@@ -0,0 +1,122 @@
+# needed < 3.14 so that annotations aren't evaluated
+from __future__ import annotations
+
+import os
+import zipfile
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pathlib
+    from typing import IO
+
+# how far into the file to look for a signature, and how far from the end
+# to look for the PDF trailer; the same leeway most PDF readers allow
+WINDOW = 1024
+
+# the types Paperless NGX consumes, as far as they have a signature: PDF,
+# the images its OCR parser handles, and (with Tika) office documents
+MAGIC: dict[bytes, str] = {
+    b"%PDF-": "pdf",
+    b"\x89PNG\r\n\x1a\n": "png",
+    b"\xff\xd8\xff": "jpeg",
+    b"II*\x00": "tiff",
+    b"MM\x00*": "tiff",
+    b"GIF87a": "gif",
+    b"GIF89a": "gif",
+    b"BM": "bmp",
+    b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1": "ole",
+    b"{\\rtf": "rtf",
+    b"PK\x03\x04": "zip",
+}
+
+# ISO base media file brands used for HEIC/HEIF images
+HEIF_BRANDS = {
+    b"heic",
+    b"heix",
+    b"heim",
+    b"heis",
+    b"hevc",
+    b"hevx",
+    b"hevm",
+    b"hevs",
+    b"mif1",
+    b"msf1",
+}
+
+# these have no signature, so go by the name
+TEXT_SUFFIXES = {".txt", ".text", ".csv", ".md", ".eml"}
+
+
+def sniff_type(head: bytes) -> str | None:
+    for magic, filetype in MAGIC.items():
+        if head.startswith(magic):
+            return filetype
+
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+
+    if head[4:8] == b"ftyp" and head[8:12] in HEIF_BRANDS:
+        return "heif"
+
+    # PDF allows for junk before the header
+    if b"%PDF-" in head:
+        return "pdf"
+
+    return None
+
+
+def check_office(f: IO[bytes]) -> None:
+    # this reads the central directory at the end of the file, so the order
+    # of the members does not matter
+    try:
+        with zipfile.ZipFile(f) as zf:
+            names = zf.namelist()
+            if "[Content_Types].xml" in names:
+                return  # OOXML
+
+            if names and names[0] == "mimetype":
+                mimetype = zf.read("mimetype")
+                if mimetype.startswith(b"application/vnd.oasis.opendocument."):
+                    return  # ODF
+
+    except zipfile.BadZipFile as err:
+        raise ValueError(f"Zip archive is damaged: {err}") from err
+
+    raise ValueError("Zip archive is not an office document")
+
+
+def check_pdf(f: IO[bytes], size: int) -> None:
+    f.seek(max(0, size - WINDOW))
+    tail = f.read()
+    if b"%%EOF" not in tail:
+        raise ValueError("PDF has no trailer, probably truncated")
+    if b"startxref" not in tail:
+        raise ValueError("PDF has no cross-reference table offset")
+
+
+def validate_file(file: pathlib.Path) -> None:
+    """Raise ValueError if the file is not worth uploading
+
+    This only reads the first and last few bytes of the file, but it is
+    blocking, so it should be run in an executor.
+    """
+    with file.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            raise ValueError("File is empty")
+
+        head = f.read(WINDOW)
+        filetype = sniff_type(head)
+
+        if filetype is None:
+            if file.suffix.lower() not in TEXT_SUFFIXES:
+                raise ValueError("File type is not supported")
+            # any encoding will do, Paperless NGX detects that by itself
+            if b"\x00" in head:
+                raise ValueError("File does not contain text")
+
+        elif filetype == "zip":
+            check_office(f)
+
+        elif filetype == "pdf":
+            check_pdf(f, size)
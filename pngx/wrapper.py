@@ -1,6 +1,8 @@
 # needed < 3.14 so that annotations aren't evaluated
 from __future__ import annotations
 
+import logging
+import unicodedata
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -12,17 +14,84 @@ if TYPE_CHECKING:
     type Cache = dict[str, int]
 
 
+logger = logging.getLogger(__name__)
+
+
+def normalise_name(name: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", name).casefold().split())
+
+
 class PaperlessObjectWrapper:
-    def __init__(self, obj: Any, *, namecol: str = "name") -> None:
+    class AmbiguousNameError(LookupError):
+        def __init__(self, name: str, candidates: set[str]) -> None:
+            super().__init__(
+                f"'{name}' could be any of: "
+                + ", ".join(f"'{c}'" for c in sorted(candidates))
+            )
+
+    def __init__(
+        self,
+        obj: Any,
+        *,
+        namecol: str = "name",
+        normalise: Callable[[str], str] | None = None,
+    ) -> None:
         self._obj = obj
         self._namecol = namecol
+        self._normalise = normalise
         self._cache: Cache = {}
+        self._names: dict[int, str] = {}
+        self._objects: dict[str, Any] = {}
+        self._normalised: Cache = {}
+        self._ambiguous: dict[str, set[str]] = {}
 
     async def _load_cache(self, *, reload: bool = False) -> None:
         if not self._cache or reload:
-            self._cache = {
-                getattr(o, self._namecol): o.id async for o in self._obj
+            self._objects = {
+                getattr(o, self._namecol): o async for o in self._obj
             }
+            self._cache = {name: o.id for name, o in self._objects.items()}
+            self._names = {id: name for name, id in self._cache.items()}
+            self._normalised = {}
+            self._ambiguous = {}
+            for name, id in self._cache.items():
+                self._add_normalised(name, id)
+
+    def _add_normalised(self, name: str, id: int) -> None:
+        if self._normalise is None:
+            return
+
+        key = self._normalise(name)
+        if key in self._ambiguous:
+            self._ambiguous[key].add(name)
+            return
+
+        if key in self._normalised and self._normalised[key] != id:
+            # several objects only differ in case or whitespace, so the
+            # normalised name cannot tell them apart
+            logger.debug(f"Normalised name '{key}' is ambiguous")
+            other = self._names[self._normalised.pop(key)]
+            self._ambiguous[key] = {other, name}
+            return
+
+        self._normalised[key] = id
+
+    async def find_name(self, name: str) -> str | None:
+        await self._load_cache()
+        if name in self._cache:
+            return name
+
+        if self._normalise is not None:
+            key = self._normalise(name)
+            if (id := self._normalised.get(key)) is not None:
+                logger.debug(f"Name '{name}' matches '{self._names[id]}'")
+                return self._names[id]
+
+            if key in self._ambiguous:
+                # creating yet another one would fail, or add to the mess
+                raise self.AmbiguousNameError(name, self._ambiguous[key])
+
+        return None
 
     async def get_id_by_name(
         self,
@@ -30,32 +99,39 @@ class PaperlessObjectWrapper:
         *,
         make: bool = False,
         make_args: Mapping[str, Any] | None = None,
-        owner: str | None = None,
+        owner: int | None = None,
         permissions_table: PermissionTableType | None = None,
         draft_cb: Callable[..., None] | None = None,
     ) -> int:
-        try:
-            await self._load_cache()
-            ret = self._cache[name]
-
-        except KeyError:
-            if make:
-                make_args = make_args or {}
-                draft = self._obj.draft(name=name, **make_args)
-                if owner:
-                    draft.owner = owner
-                if permissions_table:
-                    draft.set_permissions = permissions_table
-                if callable(draft_cb):
-                    draft_cb(draft)
-                ret = await draft.save()
-                self._cache[name] = ret
-
-            else:
-                raise
+        if (found := await self.find_name(name)) is not None:
+            return self._cache[found]
+
+        if not make:
+            raise KeyError(name)
+
+        make_args = make_args or {}
+        draft = self._obj.draft(name=name, **make_args)
+        if owner:
+            draft.owner = owner
+        if permissions_table:
+            draft.set_permissions = permissions_table
+        if callable(draft_cb):
+            draft_cb(draft)
+        ret: int = await draft.save()
+        self._cache[name] = ret
+        self._names[ret] = name
+        self._add_normalised(name, ret)
 
         return ret
 
+    async def get_name_by_id(self, id: int) -> str:
+        await self._load_cache()
+        return self._names[id]
+
     async def get_all(self, reload: bool = False) -> Cache:
         await self._load_cache(reload=reload)
         return self._cache.copy()
+
+    async def get_all_objects(self, reload: bool = False) -> dict[str, Any]:
+        await self._load_cache(reload=reload)
+        return self._objects.copy()